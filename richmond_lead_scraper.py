@@ -1,11 +1,26 @@
 import os
 import requests
-import json
-from flask import Flask, render_template_string, request, jsonify
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
+from selectolax.parser import HTMLParser
+from flask import Flask, Response, request
+from flask.json.provider import JSONProvider
 from datetime import datetime
 import time
 import re
-import pandas as pd
+import threading
+import queue
+import shelve
+import uuid
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import repeat
+from urllib.parse import unquote, urlsplit
+from openpyxl import Workbook
 
 # --------------------------------------------------------------------
 # Environment
@@ -16,165 +31,331 @@ BREVO_API_KEY = os.getenv("BREVO_API_KEY")
 if not GOOGLE_API_KEY or not BREVO_API_KEY:
     raise ValueError("Missing GOOGLE_API_KEY or BREVO_API_KEY")
 
+
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON via orjson, so /logs responses skip the stdlib encoder.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+SCRAPER_LOCK = threading.Lock()  # held for the duration of a run; prevents parallel runs
+SCRAPE_WORKERS = 16  # businesses processed in parallel; also bounds outbound requests
+CATEGORY_WORKERS = 4  # categories searched in parallel; keeps Places QPS modest
+DETAILS_WORKERS = 8  # details lookups in flight per category search
+
+# Shared keep-alive sessions: repeat calls to the same host (Places details,
+# Brevo uploads, chains on one CDN) reuse pooled connections instead of
+# re-handshaking. Transient connection errors and 429/5xx are retried briefly.
+HTTP_RETRY = Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+# urllib3 leaves POST out of its retried methods. Brevo's contact writes upsert
+# by email, so a replay after 429/5xx is safe, and a lost batch costs up to
+# BREVO_IMPORT_BATCH leads. Retry-After on 429/503 is honoured before backoff.
+BREVO_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+    raise_on_status=False,
+)
+
+
+def make_session(retry: Retry = HTTP_RETRY) -> requests.Session:
+    session = requests.Session()
+    # workers share the session, so size the pool to match and avoid discarding connections;
+    # every category search runs its own details pool, all on one Places host
+    pool_size = max(SCRAPE_WORKERS, CATEGORY_WORKERS * DETAILS_WORKERS)
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class TokenBucket:
+    """
+    Per-host rate limit shared across threads: `rate` calls per second on
+    average, with bursts of up to `burst`. acquire() takes a token under the
+    lock (going negative reserves a future one) and sleeps outside it, so
+    waiting threads don't hold up each other's bookkeeping.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate
+        if wait > 0:
+            time.sleep(wait)
+
+
+# Google Places + business websites. Never put API keys in its headers:
+# it talks to arbitrary third-party sites.
+HTTP = make_session()
+# plenty of small-business hosts reject the default python-requests agent
+HTTP.headers["User-Agent"] = "Mozilla/5.0 (compatible; RichmondLeadScraper/1.0)"
+# Accept-Encoding is left to requests: it offers br on top of gzip/deflate
+# whenever the brotli package is importable (see requirements.txt)
+
+BREVO_CONTACTS_URL = "https://api.brevo.com/v3/contacts"
+BREVO_IMPORT_URL = "https://api.brevo.com/v3/contacts/import"
+BREVO_IMPORT_BATCH = 500  # contacts per bulk import request
+BREVO_FLUSH_AT = 100  # contacts per list handed to the uploader while a run is still scraping
+BREVO_QPS = 5  # stays well under Brevo's per-second contacts API limits
+BREVO_LIMITER = TokenBucket(BREVO_QPS, burst=BREVO_QPS)
+BREVO_SESSION = make_session(BREVO_RETRY)
+BREVO_SESSION.headers.update(
+    {
+        "accept": "application/json",
+        "content-type": "application/json",
+        "api-key": BREVO_API_KEY,
+    }
+)
+
+# Placeholder domains from templates and docs; any address on them (or a
+# subdomain) is junk. Checked as a set lookup on the domain, not a substring,
+# so real domains that merely contain one (myemail.com) aren't thrown out.
+BAD_EMAIL_DOMAINS = frozenset({
+    "example.com",
+    "domain.com",
+    "website.com",
+    "mysite.com",
+    "email.com",
+    "sample.com",
+    "demo.com",
+})
+BAD_EMAIL_SUBDOMAINS = tuple("." + d for d in BAD_EMAIL_DOMAINS)  # str.endswith takes a tuple
 
-scraper_logs = []
-seen_emails = set()
-scraper_in_progress = False  # prevent multiple runs in parallel
-
-# Emails to avoid (example / dummy emails)
-AVOID_EMAILS = {
-    "johndoe@example.com",
-    "janedoe@example.com",
-    "yourname@example.com",
-    "info@example.com",
-    "contact@example.com",
-    "hello@example.com",
-    "admin@example.com",
-    "support@example.com",
-    "user@example.com",
-    "person@example.com",
-    "firstname.lastname@example.com",
+# placeholder addresses on domains that are real, so only these exact ones are blocked
+AVOID_EMAILS = frozenset({
     "name@company.com",
-    "me@example.com",
-    "team@example.com",
-    "demo@example.com",
-    "test@example.com",
-    "sample@example.com",
-    "email@example.com",
-    "myemail@example.com",
-    "user123@example.com",
-    "contactus@example.com",
     "info@company.com",
     "hello@brand.com",
     "support@service.com",
     "admin@business.com",
-    "sales@example.com",
-    "marketing@example.com",
-    "office@example.com",
-    "customerservice@example.com",
-    "feedback@example.com",
-    "help@example.com",
     "team@company.com",
-    "inquiries@example.com",
-    "press@example.com",
-    "hr@example.com",
-    "careers@example.com",
-    "owner@example.com",
-    "staff@example.com",
-    "account@example.com",
-    "service@example.com",
-    "billing@example.com",
-    "media@example.com",
-    "info@domain.com",
-    "contact@domain.com",
-    "support@domain.com",
-    "hello@domain.com",
-    "demo@domain.com",
-    "test@domain.com",
-    "name@domain.com",
-    "user@domain.com",
-    "email@domain.com",
-    "feedback@domain.com",
-    "info@website.com",
-    "contact@website.com",
-    "support@website.com",
-    "hello@website.com",
-    "sales@website.com",
-    "name@website.com",
-    "user@website.com",
-    "myname@website.com",
-    "yourname@website.com",
-    "example@website.com",
-    "test@website.com",
-    "jane.doe@website.com",
-    "john.doe@website.com",
-    "firstname@website.com",
-    "lastname@website.com",
-    "contactme@website.com",
-    "sayhello@website.com",
-    "reachout@website.com",
-    "contactform@website.com",
-    "info@mysite.com",
-    "admin@mysite.com",
-    "help@mysite.com",
-    "demo@mysite.com",
-    "user@mysite.com",
-    "support@mysite.com",
-    "hello@mysite.com",
-    "info@email.com",
-    "contact@email.com",
-    "example@email.com",
-    "user@email.com",
-    "name@email.com",
-    "test@email.com",
-    "info@sample.com",
-    "contact@sample.com",
-    "user@sample.com",
-    "hello@sample.com",
-    "name@sample.com",
-    "demo@sample.com",
-    "contact@demo.com",
-    "info@demo.com",
-    "user@demo.com",
-    "hello@demo.com",
-    "name@demo.com",
-    "test@demo.com",
-    "someone@example.com",
-    "you@example.com",
-    "your.email@example.com",
-    "contactperson@example.com",
-}
+})
 
-# extra patterns we never want
+# builder/tracker noise that can appear anywhere in the address
 BAD_EMAIL_SUBSTRINGS = [
-    "example.com",
     "wixpress",
     "sentry",
     "schema.org",
-    "domain.com",
-    "website.com",
-    "mysite.com",
-    "email.com",
-    "sample.com",
-    "demo.com",
 ]
+# one alternation scan per email instead of a Python loop over the substrings
+BAD_EMAIL_RE = re.compile("|".join(map(re.escape, BAD_EMAIL_SUBSTRINGS)))
+# same class as EMAIL_RE's local part, for backing find_email's cut off an address
+EMAIL_LOCAL_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789._%+-")
+
+# scraping patterns, compiled once at import
+# local part/domain are capped at their RFC 5321 lengths: unbounded `+` made a long
+# run of word chars (inline base64 images) quadratic, seconds per 50 KB run.
+# The lookbehind makes the local part start at a non-address character, so an
+# over-long local part is rejected rather than matched as its last 64 chars.
+EMAIL_RE = re.compile(r"(?<![A-Za-z0-9._%+-])[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,253}\.[A-Za-z]{2,}")
+WS_RE = re.compile(r"\s+")
+# re.ASCII: \d/\s/\b use ASCII tables, and \d stops matching non-ASCII digits
+# that DIGITS_ONLY would drop anyway. WS_RE stays Unicode so &nbsp; collapses.
+PHONE_RE = re.compile(r"\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}", re.ASCII)
+# "<keyword> ... First Last" or "First Last ... <keyword>" within one sentence.
+# Only the keywords are case-insensitive; a global IGNORECASE would let the
+# name pattern match any two words.
+_OWNER_KW = r"\b(?i:owner|ceo|founder|manager|director|president)\b"
+_NAME = r"\b([A-Z][a-z]+ [A-Z][a-z]+)\b"
+OWNER_RE = re.compile(_OWNER_KW + r"[^.]{0,120}?" + _NAME + "|" + _NAME + r"[^.]{0,60}?" + _OWNER_KW, re.ASCII)
+OWNER_KEYWORD_RE = re.compile(_OWNER_KW, re.ASCII)  # cheap pre-check on the raw markup
+MAX_PAGE_BYTES = 256 * 1024  # contact details sit well inside the first 256 KB of a page
+FOOTER_CHARS = 32 * 1024  # tail of the page searched for an email before the rest
+# (connect, read): a dead or parked host fails the connect in 3s instead of
+# holding a worker for the full read timeout; slow-but-alive sites keep 6s
+SITE_TIMEOUT = (3.05, 6)
 
 
 # --------------------------------------------------------------------
-# Logging helper
+# Run state + logging helper
 # --------------------------------------------------------------------
+@dataclass
+class ScraperState:
+    """
+    Everything one run owns: its log buffer, live /logs/stream clients
+    and the emails it has already queued for upload.
+    Log lines are stored as (seq, text); seq starts at 1 and only grows,
+    so clients can ask for just the lines after the last one they saw.
+    """
+
+    run_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    logs: deque = field(default_factory=lambda: deque(maxlen=400))  # oldest lines drop off in O(1)
+    seq: int = 0
+    subscribers: list = field(default_factory=list)  # one queue.Queue per open stream client
+    seen_emails: set = field(default_factory=set)
+    place_details: dict = field(default_factory=dict)  # place_id -> Future of its details lookup
+    done: bool = False
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def details_future(self, pid: str, submit):
+        """
+        The run's details lookup for pid, started with submit(pid) only if no
+        category search of this run has asked for it yet. Categories search
+        concurrently, so the on-disk cache alone can't stop a second paid call.
+        """
+        with self.lock:
+            fut = self.place_details.get(pid)
+            if fut is None:
+                fut = self.place_details[pid] = submit(pid)
+            return fut
+
+    def log(self, entry: str) -> None:
+        with self.lock:
+            self.seq += 1
+            item = (self.seq, entry)
+            self.logs.append(item)
+            for q in self.subscribers:
+                q.put_nowait(item)
+
+    def since(self, seq: int):
+        """
+        Lines after `seq` plus the current last seq and done flag.
+        """
+        with self.lock:
+            lines = [item for item in self.logs if item[0] > seq]
+            return lines, self.seq, self.done
+
+    def subscribe(self, seq: int = 0):
+        """
+        Returns (backlog after seq, queue, done) taken atomically, so no line
+        is missed or sent twice between the replay and the live feed.
+        """
+        q = queue.Queue()
+        with self.lock:
+            self.subscribers.append(q)
+            return [item for item in self.logs if item[0] > seq], q, self.done
+
+    def unsubscribe(self, q) -> None:
+        with self.lock:
+            self.subscribers.remove(q)
+
+    def finish(self) -> None:
+        with self.lock:
+            self.done = True
+            for q in self.subscribers:
+                q.put_nowait(None)  # end-of-run marker for stream clients
+
+
+MAX_RUNS_KEPT = 10  # finished runs whose logs stay readable
+RUNS = {}  # run_id -> ScraperState, oldest first
+RUNS_LOCK = threading.Lock()
+# run the current thread is working for; pool workers get it via their initializer
+CURRENT_RUN = ContextVar("CURRENT_RUN", default=None)
+
+
+def register_run() -> ScraperState:
+    state = ScraperState()
+    with RUNS_LOCK:
+        RUNS[state.run_id] = state
+        finished = [rid for rid, st in RUNS.items() if st.done]
+        for rid in finished[: max(0, len(finished) - MAX_RUNS_KEPT)]:
+            del RUNS[rid]
+    return state
+
+
+def get_run(run_id):
+    """
+    Look up a run by id; with no id, the most recently started run.
+    """
+    with RUNS_LOCK:
+        if run_id:
+            return RUNS.get(run_id)
+        return next(reversed(RUNS.values()), None)
+
+
 def log_message(message: str) -> None:
     timestamp = datetime.now().strftime("%H:%M:%S")
     entry = f"[{timestamp}] {message}"
     print(entry)
-    scraper_logs.append(entry)
-    if len(scraper_logs) > 400:
-        scraper_logs.pop(0)
+    state = CURRENT_RUN.get()
+    if state is not None:
+        state.log(entry)
+
+
+def format_sse(item) -> str:
+    seq, entry = item
+    # multi-line entries (e.g. exception text) need one data: field per line;
+    # the id comes back as Last-Event-ID when the browser reconnects
+    return f"id: {seq}\n" + "".join(f"data: {line}\n" for line in entry.splitlines()) + "\n"
 
 
 # --------------------------------------------------------------------
 # Google Places helper
 # --------------------------------------------------------------------
-def get_businesses_from_google(category: str, zipcode: str, radius_miles: str, max_results: int = 60):
-    radius_meters = int(radius_miles) * 1609
-    query = f"{category} near {zipcode}"
-    url = (
-        "https://maps.googleapis.com/maps/api/place/textsearch/json"
-        f"?query={requests.utils.quote(query)}&radius={radius_meters}&key={GOOGLE_API_KEY}"
-    )
-    log_message(f"🔎 Searching {category} near {zipcode} ({radius_miles} mi radius)…")
+# On-disk cache of Places responses, so repeat runs over the same ZIP/category
+# skip the text-search pagination waits and the per-result details calls.
+# Entries are (timestamp, value); shelve isn't thread-safe, hence the lock.
+CACHE_DIR = "cache"  # on-disk state that outlives a run (Places responses, uploaded emails)
+PLACES_SEARCH_TTL = 24 * 3600  # business lists change; re-search daily
+PLACES_DETAILS_TTL = 30 * 24 * 3600  # websites/phones rarely change
+os.makedirs(CACHE_DIR, exist_ok=True)
+PLACES_CACHE = shelve.open(os.path.join(CACHE_DIR, "places"))
+PLACES_CACHE_LOCK = threading.Lock()
+
+
+def places_cache_get(key: str, ttl: int):
+    with PLACES_CACHE_LOCK:
+        hit = PLACES_CACHE.get(key)
+    if hit is None or time.time() - hit[0] > ttl:
+        return None
+    return hit[1]
+
+
+def places_cache_set(key: str, value) -> None:
+    with PLACES_CACHE_LOCK:
+        PLACES_CACHE[key] = (time.time(), value)
+        PLACES_CACHE.sync()
+
+
+PLACES_TEXTSEARCH_URL = "https://maps.googleapis.com/maps/api/place/textsearch/json"
+PLACES_DETAILS_URL = "https://maps.googleapis.com/maps/api/place/details/json"
+# details are billed by field group; ask only for what the scrape uses
+PLACES_DETAILS_PARAMS = {"fields": "name,website,formatted_phone_number", "key": GOOGLE_API_KEY}
+PLACES_QPS = 10  # Google's default per-project Places rate
+
+
+# shared by every category search and details worker
+PLACES_LIMITER = TokenBucket(PLACES_QPS, burst=PLACES_QPS)
+
+
+def search_places(query: str, radius_meters: int, max_results: int):
+    """
+    Text Search with pagination; returns (name, place_id) dicts.
+    Cached for PLACES_SEARCH_TTL so repeat searches skip the 2s page-token waits.
+    """
+    cache_key = f"search:{query}|{radius_meters}|{max_results}"
+    cached = places_cache_get(cache_key, PLACES_SEARCH_TTL)
+    if cached is not None:
+        return cached
 
+    params = {"query": query, "radius": radius_meters, "key": GOOGLE_API_KEY}
     all_results = []
-    page_token = None
 
     while True:
-        final_url = url
-        if page_token:
-            final_url += f"&pagetoken={page_token}"
-
-        resp = requests.get(final_url)
-        data = resp.json()
+        PLACES_LIMITER.acquire()
+        resp = HTTP.get(PLACES_TEXTSEARCH_URL, params=params)
+        data = orjson.loads(resp.content)
         results = data.get("results", [])
         all_results.extend(results)
 
@@ -184,36 +365,89 @@ def get_businesses_from_google(category: str, zipcode: str, radius_miles: str, m
         page_token = data.get("next_page_token")
         if not page_token:
             break
+        params["pagetoken"] = page_token
 
+        # not rate limiting: a fresh next_page_token is INVALID_REQUEST for ~2s
         time.sleep(2.0)
 
-    log_message(f"📍 Retrieved {len(all_results)} {category} results total.")
-
-    businesses = []
-    for r in all_results[:max_results]:
-        name = r.get("name", "Unknown Business")
+    # pages can overlap when results shift between requests; one details call per place
+    by_id = {}
+    for r in all_results:
         pid = r.get("place_id")
-        details_url = (
-            "https://maps.googleapis.com/maps/api/place/details/json"
-            f"?place_id={pid}&fields=name,website,formatted_phone_number&key={GOOGLE_API_KEY}"
-        )
-        det = requests.get(details_url).json().get("result", {})
-        businesses.append(
-            {
-                "name": name,
-                "website": det.get("website", ""),
-                "phone": det.get("formatted_phone_number", ""),
-                "category": category,
-            }
-        )
-        time.sleep(0.2)
-
-    return businesses
+        # closed-for-good listings still show up in search; don't pay a details call for them
+        if r.get("business_status") == "CLOSED_PERMANENTLY":
+            continue
+        if pid and pid not in by_id:
+            by_id[pid] = {"name": r.get("name", "Unknown Business"), "place_id": pid}
+    places = list(by_id.values())[:max_results]
+    # an empty list is more likely an API error than a real answer; don't pin it
+    if places:
+        places_cache_set(cache_key, places)
+    return places
+
+
+def get_place_details(pid: str) -> dict:
+    """Website + phone for a place, cached on disk for PLACES_DETAILS_TTL."""
+    cache_key = f"details:{pid}"
+    det = places_cache_get(cache_key, PLACES_DETAILS_TTL)
+    if det is not None:
+        return det
+
+    # only live calls are paced; cache hits cost Google nothing
+    PLACES_LIMITER.acquire()
+    data = orjson.loads(HTTP.get(PLACES_DETAILS_URL, params={**PLACES_DETAILS_PARAMS, "place_id": pid}).content)
+    det = data.get("result", {})
+    if data.get("status") == "OK":
+        places_cache_set(cache_key, det)
+    return det
+
+
+def get_businesses_from_google(category: str, zipcode: str, radius_miles: str, max_results: int = 60):
+    radius_meters = int(radius_miles) * 1609
+    query = f"{category} near {zipcode}"
+    log_message(f"🔎 Searching {category} near {zipcode} ({radius_miles} mi radius)…")
+
+    places = search_places(query, radius_meters, max_results)
+
+    log_message(f"📍 Retrieved {len(places)} {category} results total.")
+
+    # details calls overlap; PLACES_LIMITER keeps the combined rate under quota
+    state = CURRENT_RUN.get()
+    with ThreadPoolExecutor(max_workers=DETAILS_WORKERS, initializer=CURRENT_RUN.set, initargs=(state,)) as ex:
+        if state is None:
+            details = list(ex.map(get_place_details, [r["place_id"] for r in places]))
+        else:
+            # a place listed under several categories (Cafes + Coffee Shops) is looked up once
+            submit = partial(ex.submit, get_place_details)
+            futures = [state.details_future(r["place_id"], submit) for r in places]
+            details = [f.result() for f in futures]
+
+    return [
+        {
+            "name": r["name"],
+            "website": det.get("website", ""),
+            "phone": det.get("formatted_phone_number", ""),
+            "category": category,
+            "place_id": r["place_id"],
+        }
+        for r, det in zip(places, details)
+    ]
 
 
 # --------------------------------------------------------------------
 # Phone helpers
 # --------------------------------------------------------------------
+class _DigitsOnlyTable(dict):
+    """str.translate table: ASCII digits map to themselves, any other char is deleted."""
+
+    def __missing__(self, code):
+        self[code] = None
+        return None
+
+
+DIGITS_ONLY = _DigitsOnlyTable({c: c for c in range(ord("0"), ord("9") + 1)})
+
+
 def normalize_phone_for_sms(raw_phone: str) -> str:
     """
     Convert things like '804-555-1234' or '(804) 555 1234'
@@ -222,7 +456,7 @@ def normalize_phone_for_sms(raw_phone: str) -> str:
     if not raw_phone:
         return ""
 
-    digits = re.sub(r"\D", "", raw_phone)
+    digits = raw_phone.translate(DIGITS_ONLY)
 
     # US 10-digit number → +1XXXXXXXXXX
     if len(digits) == 10:
@@ -239,70 +473,214 @@ def normalize_phone_for_sms(raw_phone: str) -> str:
 # --------------------------------------------------------------------
 # Email + owner extraction from website
 # --------------------------------------------------------------------
-def find_email_on_website(url: str) -> str:
-    if not url:
-        return ""
-    try:
-        r = requests.get(url, timeout=6)
-        emails = re.findall(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", r.text)
-        for e in emails:
-            e_lower = e.lower()
-            if e_lower in AVOID_EMAILS:
-                continue
-            if any(bad in e_lower for bad in BAD_EMAIL_SUBSTRINGS):
-                continue
+def fetch_html(url: str) -> str:
+    """
+    GET a page and return at most MAX_PAGE_BYTES of it as text.
+    The body is streamed so huge pages stop downloading at the cap;
+    non-HTML responses (PDFs, images) return "" without reading the body.
+    """
+    with HTTP.get(url, timeout=SITE_TIMEOUT, stream=True) as r:
+        ctype = r.headers.get("Content-Type", "")
+        if ctype and "html" not in ctype and not ctype.startswith("text/"):
+            return ""
+        body = bytearray()
+        for chunk in r.iter_content(16 * 1024):
+            body += chunk
+            if len(body) >= MAX_PAGE_BYTES:
+                break
+    # requests assumes ISO-8859-1 for text/* without a charset; the web is mostly UTF-8
+    encoding = r.encoding if "charset" in ctype.lower() else "utf-8"
+    return body[:MAX_PAGE_BYTES].decode(encoding or "utf-8", errors="replace")
+
+
+def is_bad_email(email: str) -> bool:
+    """True for placeholder/dummy addresses and known junk (expects lowercase)."""
+    domain = email.rpartition("@")[2]
+    return (
+        domain in BAD_EMAIL_DOMAINS
+        or domain.endswith(BAD_EMAIL_SUBDOMAINS)
+        or email in AVOID_EMAILS
+        or BAD_EMAIL_RE.search(email) is not None
+    )
+
+
+def first_email(html: str, checked: set, pos: int, stop: int) -> str:
+    # finditer stops scanning at the first usable address; searching from pos
+    # (rather than a slice) lets EMAIL_RE's lookbehind see the character before it.
+    # Only addresses starting before stop count, though they may run past it.
+    for m in EMAIL_RE.finditer(html, pos):
+        if m.start() >= stop:
+            break
+        e = m.group(0)
+        e_lower = e.lower()
+        # pages repeat the same address (header, footer, mailto); filter each once
+        if e_lower in checked:
+            continue
+        checked.add(e_lower)
+        if not is_bad_email(e_lower):
             return e
-    except Exception as exc:
-        log_message(f"Error scanning {url} for email: {exc}")
     return ""
 
 
-def find_owner_name_and_phone(url: str):
-    if not url:
-        return "", ""
-    try:
-        r = requests.get(url, timeout=6)
-        txt = re.sub(r"<[^>]*>", " ", r.text)
-        txt = re.sub(r"\s+", " ", txt)
+def find_email(html: str) -> str:
+    """
+    First usable address in the raw HTML, footer first. Scans markup,
+    not text, so addresses that only appear in mailto: hrefs are found too.
+    """
+    if "@" not in html:
+        # no address possible; skip the regex over the whole page
+        return ""
+    checked = set()
+    cut = max(0, len(html) - FOOTER_CHARS)
+    # the contact block usually sits in the footer: scan the tail, then the rest.
+    # Back the cut off any local part it lands in (at most 64 chars, the RFC
+    # limit) so the tail never starts mid-address; the head covers addresses
+    # that start before the cut, wherever they end.
+    floor = max(0, cut - 64)
+    while cut > floor and html[cut - 1] in EMAIL_LOCAL_CHARS:
+        cut -= 1
+    return first_email(html, checked, cut, len(html)) or (first_email(html, checked, 0, cut) if cut else "")
+
+
+def mailto_email(tree: HTMLParser) -> str:
+    """
+    First usable address from the page's mailto: links, or "".
+    A mailto: link is an address the site chose to publish, so it is
+    preferred over whatever the raw-HTML scan happens to hit first.
+    """
+    for link in tree.css('a[href^="mailto:"]'):
+        m = EMAIL_RE.search(unquote(link.attributes.get("href") or ""))
+        if m and not is_bad_email(m.group(0).lower()):
+            return m.group(0)
+    return ""
 
-        owner_keywords = ["owner", "ceo", "founder", "manager", "director", "president"]
 
-        for line in txt.split("."):
-            if any(k in line.lower() for k in owner_keywords):
-                nm = re.search(r"\b([A-Z][a-z]+ [A-Z][a-z]+)\b", line)
-                if nm:
-                    ph_match = re.search(r"\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}", txt)
-                    phone = ph_match.group(0) if ph_match else ""
-                    return nm.group(1), phone
+def tel_link_phone(tree: HTMLParser) -> str:
+    """
+    Number from the page's first tel: link, or "" if it has none.
+    A tel: link is the site's own click-to-call number, so it beats
+    the first phone-shaped string found in the text.
+    """
+    link = tree.css_first('a[href^="tel:"]')
+    if link is None:
+        return ""
+    return unquote(link.attributes.get("href") or "")[4:].strip()
 
-        ph_match = re.search(r"\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}", txt)
-        phone = ph_match.group(0) if ph_match else ""
+
+def page_text(tree: HTMLParser) -> str:
+    """
+    Visible text of a parsed page (scripts/styles dropped),
+    with whitespace collapsed for the name/phone patterns.
+    """
+    tree.strip_tags(["script", "style", "noscript"])
+    root = tree.body or tree.root
+    if root is None:
+        return ""
+    return WS_RE.sub(" ", root.text(separator=" "))
+
+
+def find_owner_name_and_phone(html: str, tree: HTMLParser):
+    phone = tel_link_phone(tree)
+    # no keyword anywhere in the markup means no keyword in the visible text either
+    may_have_owner = OWNER_KEYWORD_RE.search(html) is not None
+    if phone and not may_have_owner:
+        # nothing left that needs the page text; skip building it
         return "", phone
+
+    txt = page_text(tree)
+
+    if not phone:
+        ph_match = PHONE_RE.search(txt)
+        phone = ph_match.group(0) if ph_match else ""
+
+    # one pass over the text instead of a window per keyword hit
+    m = OWNER_RE.search(txt) if may_have_owner else None
+    if m:
+        return m.group(1) or m.group(2), phone
+
+    return "", phone
+
+
+def normalize_site_url(url: str) -> str:
+    """
+    Normalize a website URL so trivially different spellings
+    (scheme, host case, trailing slash, query/fragment) share one cache entry.
+    """
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip("/")
+    return f"{parts.scheme.lower() or 'http'}://{parts.netloc.lower()}{path}"
+
+
+def business_key(biz: dict) -> str:
+    """
+    Dedup key for a business without a place_id: case-insensitive name plus
+    website host, so scheme, 'www.', path and trailing-slash differences don't count.
+    """
+    host = urlsplit(biz.get("website", "").strip().lower()).netloc
+    if host.startswith("www."):
+        host = host[4:]
+    return f"{biz['name'].strip().lower()}|{host}"
+
+
+@lru_cache(maxsize=2048)
+def scrape_site(url: str):
+    """
+    Fetch email, owner and phone for one (normalized) website URL.
+    The page is downloaded once and both extractors read that copy.
+    Cached so chains/franchises sharing a site are only scraped once per run.
+    """
+    if not url:
+        return "", "", ""
+    try:
+        html = fetch_html(url)
     except Exception as exc:
-        log_message(f"Error parsing {url} for owner/phone: {exc}")
-        return "", ""
+        log_message(f"Error fetching {url}: {exc}")
+        return "", "", ""
+
+    try:
+        # one parse shared by the link lookups and the text extraction
+        tree = HTMLParser(html)
+        email = mailto_email(tree) or find_email(html)
+        owner, phone = find_owner_name_and_phone(html, tree)
+    except Exception as exc:
+        log_message(f"Error parsing {url}: {exc}")
+        email, owner, phone = find_email(html), "", ""
+    return email, owner, phone
 
 
 # --------------------------------------------------------------------
 # Brevo insertion
 # --------------------------------------------------------------------
-def add_to_brevo(contact: dict, has_email: bool = True):
+# Emails already accepted by Brevo in any earlier run (email -> upload time).
+# The per-run seen_emails set only catches repeats within one run; this keeps
+# the same leads from being re-sent run after run. Exact, so no false skips.
+UPLOADED_EMAILS = shelve.open(os.path.join(CACHE_DIR, "uploaded_emails"))
+UPLOADED_EMAILS_LOCK = threading.Lock()
+
+
+def already_uploaded(email: str) -> bool:
+    with UPLOADED_EMAILS_LOCK:
+        return email.lower() in UPLOADED_EMAILS
+
+
+def remember_uploaded(emails) -> None:
+    now = time.time()
+    with UPLOADED_EMAILS_LOCK:
+        for e in emails:
+            UPLOADED_EMAILS[e.lower()] = now
+        UPLOADED_EMAILS.sync()
+
+
+def brevo_contact(contact: dict, has_email: bool = True) -> dict:
     """
-    Send contact to Brevo:
-      - List 3 if it has an email
-      - List 5 if it does not (we generate a placeholder email)
+    Build the Brevo contact body (email + attributes):
+      - a placeholder email is generated when there is none (List 5)
       - Map phone to BOTH:
           - attributes['PHONE'] (for your custom column if you enable it)
           - attributes['sms']   (what Brevo actually uses for phone/SMS)
     """
-
-    url = "https://api.brevo.com/v3/contacts"
-    headers = {
-        "accept": "application/json",
-        "content-type": "application/json",
-        "api-key": BREVO_API_KEY,
-    }
-
     raw_phone = (contact.get("phone") or "").strip()
     sms_phone = normalize_phone_for_sms(raw_phone)
 
@@ -321,32 +699,116 @@ def add_to_brevo(contact: dict, has_email: bool = True):
 
     email_value = contact.get("email") if has_email else f"{contact['name'].replace(' ', '').lower()}@placeholder.com"
 
-    payload = {
-        "email": email_value,
-        "attributes": attrs,
-        "listIds": [3 if has_email else 5],
-    }
+    return {"email": email_value, "attributes": attrs}
+
+
+def add_to_brevo(contact: dict, has_email: bool = True):
+    """
+    Send a single contact to Brevo:
+      - List 3 if it has an email
+      - List 5 if it does not (we generate a placeholder email)
+    Used as the fallback when a bulk import request is rejected.
+    """
+    payload = brevo_contact(contact, has_email)
+    payload["listIds"] = [3 if has_email else 5]
 
-    r = requests.post(url, headers=headers, data=json.dumps(payload))
+    BREVO_LIMITER.acquire()
+    r = BREVO_SESSION.post(BREVO_CONTACTS_URL, data=orjson.dumps(payload))
+    if r.ok and has_email:
+        remember_uploaded([payload["email"]])
 
     log_message(
         f"Added to Brevo (List {'3' if has_email else '5'}): "
-        f"{email_value} | phone_raw='{raw_phone}' sms='{sms_phone}' ({r.status_code})"
+        f"{payload['email']} | phone_raw='{payload['attributes']['PHONE']}' "
+        f"sms='{payload['attributes'].get('sms', '')}' ({r.status_code})"
     )
 
 
+def import_to_brevo(contacts: list, has_email: bool = True):
+    """
+    Upload contacts through Brevo's bulk /contacts/import endpoint,
+    BREVO_IMPORT_BATCH per request instead of one POST per contact.
+    A rejected batch falls back to per-contact add_to_brevo.
+    """
+    list_id = 3 if has_email else 5
+    for i in range(0, len(contacts), BREVO_IMPORT_BATCH):
+        batch = contacts[i : i + BREVO_IMPORT_BATCH]
+        payload = {
+            "listIds": [list_id],
+            "jsonBody": [brevo_contact(c, has_email) for c in batch],
+        }
+        try:
+            BREVO_LIMITER.acquire()
+            r = BREVO_SESSION.post(BREVO_IMPORT_URL, data=orjson.dumps(payload))
+        except requests.RequestException as exc:
+            log_message(f"⚠️ Brevo import failed for List {list_id}: {exc}; uploading one by one.")
+        else:
+            if r.ok:
+                log_message(f"📤 Imported {len(batch)} contacts to Brevo (List {list_id}) ({r.status_code})")
+                if has_email:
+                    remember_uploaded(c["email"] for c in batch)
+                continue
+            log_message(f"⚠️ Brevo import rejected for List {list_id} ({r.status_code}); uploading one by one.")
+
+        for c in batch:
+            # one unreachable contact must not drop the rest of the batch
+            try:
+                add_to_brevo(c, has_email=has_email)
+            except requests.RequestException as exc:
+                log_message(f"⚠️ Brevo upload failed for {c.get('email') or c.get('name', '')}: {exc}")
+
+
+# --------------------------------------------------------------------
+# Excel export
+# --------------------------------------------------------------------
+EXCEL_COLUMNS = ["Business Name", "Email", "Phone", "Website", "Owner Name", "Category", "List"]
+
+
+def write_excel(fname: str, rows: list) -> None:
+    """
+    Stream rows into an .xlsx with openpyxl's write-only mode:
+    rows go straight to the sheet XML, no DataFrame or in-memory cell grid.
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(EXCEL_COLUMNS)
+    for row in rows:
+        ws.append([row.get(col, "") for col in EXCEL_COLUMNS])
+    wb.save(fname)
+
+
 # --------------------------------------------------------------------
 # Core scraper process
 # --------------------------------------------------------------------
-def run_scraper_process(categories, zipcode, radius):
-    global scraper_in_progress
-    if scraper_in_progress:
-        log_message("⚠️ A scraper is already running. Please wait for it to finish.")
-        return
+def process_one_business(biz: dict, stop: threading.Event):
+    """
+    Scrape one business's website and return its contact dict.
+    Returns None if the run was stopped before it got to this business.
+    """
+    if stop.is_set():
+        return None
+
+    website = biz.get("website", "")
+    base_phone = biz.get("phone", "")
+
+    if website:
+        email, owner, phone_from_site = scrape_site(normalize_site_url(website))
+    else:
+        # nothing to scrape; goes straight to List 5 with the Google phone
+        email, owner, phone_from_site = "", "", ""
+
+    return {
+        "name": biz["name"],
+        "phone": phone_from_site or base_phone,
+        "website": website,
+        "email": email,
+        "owner_name": owner,
+        "category": biz.get("category", ""),
+    }
+
 
-    scraper_in_progress = True
-    scraper_logs.clear()
-    seen_emails.clear()
+def run_scraper_process(state: ScraperState, categories, zipcode, radius):
+    scrape_site.cache_clear()
 
     log_message("🚀 Scraper started.")
 
@@ -356,101 +818,131 @@ def run_scraper_process(categories, zipcode, radius):
 
     start_time = time.time()
     all_businesses = []
-    seen_business_keys = set()
+    seen_businesses = set()  # place_id, or business_key when there is none
+
+    # 1. Gather businesses from all selected categories. Categories are fetched
+    #    concurrently so their Places pagination waits and details lookups overlap;
+    #    results are still merged in the order the categories were selected.
+    with ThreadPoolExecutor(max_workers=CATEGORY_WORKERS, initializer=CURRENT_RUN.set, initargs=(state,)) as ex:
+        futures = [ex.submit(get_businesses_from_google, c, zipcode, radius) for c in categories]
+        for fut in futures:
+            for b in fut.result():
+                # same place listed under several categories (e.g. Cafes + Coffee Shops).
+                # place_id is the identity; name/host is only a fallback without one, as
+                # chain stores share a name and host but are separate leads with their own phone
+                key = b.get("place_id") or business_key(b)
+                if key in seen_businesses:
+                    continue
+                seen_businesses.add(key)
+                all_businesses.append(b)
 
-    # 1. Gather businesses from all selected categories
-    for c in categories:
-        if time.time() - start_time > TIMEOUT_SECONDS and len(all_businesses) >= MIN_CONTACTS:
-            log_message("⏱ Timeout reached while fetching businesses; continuing with what we have.")
-            break
+            if len(all_businesses) >= MAX_BUSINESSES:
+                log_message(f"⛔ Hit MAX_BUSINESSES limit of {MAX_BUSINESSES}.")
+                break
 
-        biz_list = get_businesses_from_google(c, zipcode, radius)
-        for b in biz_list:
-            key = (b["name"], b["website"])
-            if key not in seen_business_keys:
-                seen_business_keys.add(key)
-                all_businesses.append(b)
+            if time.time() - start_time > TIMEOUT_SECONDS and len(all_businesses) >= MIN_CONTACTS:
+                log_message("⏱ Timeout reached while fetching businesses; continuing with what we have.")
+                break
 
-        if len(all_businesses) >= MAX_BUSINESSES:
-            log_message(f"⛔ Hit MAX_BUSINESSES limit of {MAX_BUSINESSES}.")
-            break
+        # categories that haven't started yet are dropped; running ones finish on exit
+        for fut in futures:
+            fut.cancel()
 
     log_message(f"📊 Total unique businesses collected: {len(all_businesses)}")
 
-    # 2. Process each business, upload to Brevo, and store for Excel
+    # 2. Scrape businesses in parallel; dedup and queue them for Brevo and Excel.
+    #    Every BREVO_FLUSH_AT contacts of a list go to a single uploader thread,
+    #    so Brevo imports overlap the remaining scrapes instead of trailing them.
     uploaded = 0
+    no_website = 0
     rows_for_excel = []
+    pending = {True: [], False: []}  # has_email -> contacts not yet handed to the uploader
+    uploads = []
+    stop = threading.Event()
+
+    def flush(has_email: bool) -> None:
+        if pending[has_email]:
+            uploads.append(uploader.submit(import_to_brevo, pending[has_email], has_email))
+            pending[has_email] = []
+
+    with ThreadPoolExecutor(max_workers=1, initializer=CURRENT_RUN.set, initargs=(state,)) as uploader, \
+            ThreadPoolExecutor(max_workers=SCRAPE_WORKERS, initializer=CURRENT_RUN.set, initargs=(state,)) as ex:
+        # map() yields in input order, so the Excel rows stay deterministic
+        for contact in ex.map(process_one_business, all_businesses, repeat(stop)):
+            if contact is None:
+                continue
 
-    for biz in all_businesses:
-        if time.time() - start_time > TIMEOUT_SECONDS and uploaded >= MIN_CONTACTS:
-            log_message("⏱ Timeout reached during processing; stopping uploads.")
-            break
-
-        website = biz.get("website", "")
-        base_phone = biz.get("phone", "")
-
-        email = find_email_on_website(website)
-        owner, phone_from_site = find_owner_name_and_phone(website)
-
-        final_phone = phone_from_site or base_phone
+            email = contact["email"]
+            if email:
+                if email in state.seen_emails:
+                    log_message(f"⚠️ Duplicate skipped before upload: {email}")
+                    continue
+                state.seen_emails.add(email)
+                if already_uploaded(email):
+                    log_message(f"⏭ Already in Brevo from an earlier run: {email}")
+                    continue
+                log_message(f"✅ {contact['name']} ({email}) → List 3")
+            else:
+                log_message(f"📇 {contact['name']} (No Email) → List 5")
+            has_email = bool(email)
+            pending[has_email].append(contact)
+            if len(pending[has_email]) >= BREVO_FLUSH_AT:
+                flush(has_email)
 
-        contact = {
-            "name": biz["name"],
-            "phone": final_phone,
-            "website": website,
-            "email": email,
-            "owner_name": owner,
-        }
-
-        if email:
-            if email in seen_emails:
-                log_message(f"⚠️ Duplicate skipped before upload: {email}")
-                continue
-            add_to_brevo(contact, has_email=True)
-            seen_emails.add(email)
             uploaded += 1
-            log_message(f"✅ {biz['name']} ({email}) → List 3")
+            if not contact["website"]:
+                no_website += 1
             rows_for_excel.append(
                 {
-                    "Business Name": biz["name"],
+                    "Business Name": contact["name"],
                     "Email": email,
-                    "Phone": final_phone,
-                    "Website": website,
-                    "Owner Name": owner,
-                    "Category": biz.get("category", ""),
-                    "List": "3",
-                }
-            )
-        else:
-            add_to_brevo(contact, has_email=False)
-            uploaded += 1
-            log_message(f"📇 {biz['name']} (No Email) → List 5")
-            rows_for_excel.append(
-                {
-                    "Business Name": biz["name"],
-                    "Email": "",
-                    "Phone": final_phone,
-                    "Website": website,
-                    "Owner Name": owner,
-                    "Category": biz.get("category", ""),
-                    "List": "5",
+                    "Phone": contact["phone"],
+                    "Website": contact["website"],
+                    "Owner Name": contact["owner_name"],
+                    "Category": contact["category"],
+                    "List": "3" if email else "5",
                 }
             )
 
-        time.sleep(0.5)
+            if not stop.is_set() and time.time() - start_time > TIMEOUT_SECONDS and uploaded >= MIN_CONTACTS:
+                log_message("⏱ Timeout reached during processing; stopping uploads.")
+                # queued businesses bail out; keep draining so in-flight scrapes are recorded
+                stop.set()
+
+        # 3. Hand the remainder to the uploader; leaving the block waits for it
+        flush(True)
+        flush(False)
+
+    for fut in uploads:
+        if fut.exception() is not None:
+            log_message(f"⚠️ Brevo upload failed: {fut.exception()}")
+
+    if no_website:
+        log_message(f"🌐 {no_website} businesses had no website; site scrape skipped.")
 
-    # 3. Save to Excel
+    # 4. Save to Excel
     try:
         os.makedirs("runs", exist_ok=True)
         fname = f"runs/run_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-        df = pd.DataFrame(rows_for_excel)
-        df.to_excel(fname, index=False)
+        write_excel(fname, rows_for_excel)
         log_message(f"📁 Saved as {fname}")
     except Exception as exc:
         log_message(f"⚠️ Failed to save Excel: {exc}")
 
     log_message(f"🎯 Finished — {uploaded} uploaded.")
-    scraper_in_progress = False
+
+
+def run_scraper_locked(state: ScraperState, categories, zipcode, radius):
+    """
+    Thread target for /run: the caller has already acquired SCRAPER_LOCK,
+    which is released here even if the scraper raises.
+    """
+    CURRENT_RUN.set(state)
+    try:
+        run_scraper_process(state, categories, zipcode, radius)
+    finally:
+        state.finish()
+        SCRAPER_LOCK.release()
 
 
 # --------------------------------------------------------------------
@@ -517,110 +1009,111 @@ button,input[type=text]{
 
 
 # --------------------------------------------------------------------
-# Routes
+# Static pages (rendered once at import; they never change between deploys)
 # --------------------------------------------------------------------
-@app.route("/")
-def home():
-    grouped = {
-        "Food & Drink": [
-            "Restaurants",
-            "Bars & Clubs",
-            "Coffee Shops",
-            "Bakeries",
-            "Breweries",
-            "Cafes",
-            "Juice Bars",
-        ],
-        "Retail & Shopping": [
-            "Retail Stores",
-            "Boutiques",
-            "Clothing Stores",
-            "Gift Shops",
-            "Bookstores",
-            "Home Goods Stores",
-        ],
-        "Beauty & Wellness": [
-            "Salons",
-            "Barbers",
-            "Spas",
-            "Massage Therapy",
-            "Nail Salons",
-        ],
-        "Fitness & Recreation": [
-            "Gyms",
-            "Yoga Studios",
-            "Martial Arts",
-            "CrossFit",
-            "Dance Studios",
-        ],
-        "Home Services": [
-            "HVAC",
-            "Plumbing",
-            "Electricians",
-            "Landscaping",
-            "Cleaning Services",
-            "Painting",
-            "Roofing",
-            "Pest Control",
-        ],
-        "Auto Services": [
-            "Auto Repair",
-            "Car Wash",
-            "Tire Shops",
-            "Car Dealerships",
-            "Detailing",
-        ],
-        "Insurance & Finance": [
-            "Insurance Agencies",
-            "Banks",
-            "Credit Unions",
-            "Financial Advisors",
-        ],
-        "Events & Entertainment": [
-            "Event Venues",
-            "Wedding Planners",
-            "Catering",
-            "Escape Rooms",
-            "Putt Putt",
-            "Bowling Alleys",
-        ],
-        "Construction & Real Estate": [
-            "Construction Companies",
-            "Contractors",
-            "Real Estate Agencies",
-            "Home Builders",
-        ],
-        "Health & Medical": [
-            "Dentists",
-            "Doctors",
-            "Chiropractors",
-            "Physical Therapy",
-            "Veterinarians",
-        ],
-        "Pets": [
-            "Pet Groomers",
-            "Pet Boarding",
-            "Pet Stores",
-        ],
-        "Education & Childcare": [
-            "Daycares",
-            "Private Schools",
-            "Tutoring Centers",
-            "Learning Centers",
-        ],
-        "Professional Services": [
-            "Law Firms",
-            "Accountants",
-            "Consulting Firms",
-        ],
-        "Community & Nonprofits": [
-            "Churches",
-            "Nonprofits",
-            "Community Centers",
-        ],
-    }
+CATEGORY_GROUPS = {
+    "Food & Drink": [
+        "Restaurants",
+        "Bars & Clubs",
+        "Coffee Shops",
+        "Bakeries",
+        "Breweries",
+        "Cafes",
+        "Juice Bars",
+    ],
+    "Retail & Shopping": [
+        "Retail Stores",
+        "Boutiques",
+        "Clothing Stores",
+        "Gift Shops",
+        "Bookstores",
+        "Home Goods Stores",
+    ],
+    "Beauty & Wellness": [
+        "Salons",
+        "Barbers",
+        "Spas",
+        "Massage Therapy",
+        "Nail Salons",
+    ],
+    "Fitness & Recreation": [
+        "Gyms",
+        "Yoga Studios",
+        "Martial Arts",
+        "CrossFit",
+        "Dance Studios",
+    ],
+    "Home Services": [
+        "HVAC",
+        "Plumbing",
+        "Electricians",
+        "Landscaping",
+        "Cleaning Services",
+        "Painting",
+        "Roofing",
+        "Pest Control",
+    ],
+    "Auto Services": [
+        "Auto Repair",
+        "Car Wash",
+        "Tire Shops",
+        "Car Dealerships",
+        "Detailing",
+    ],
+    "Insurance & Finance": [
+        "Insurance Agencies",
+        "Banks",
+        "Credit Unions",
+        "Financial Advisors",
+    ],
+    "Events & Entertainment": [
+        "Event Venues",
+        "Wedding Planners",
+        "Catering",
+        "Escape Rooms",
+        "Putt Putt",
+        "Bowling Alleys",
+    ],
+    "Construction & Real Estate": [
+        "Construction Companies",
+        "Contractors",
+        "Real Estate Agencies",
+        "Home Builders",
+    ],
+    "Health & Medical": [
+        "Dentists",
+        "Doctors",
+        "Chiropractors",
+        "Physical Therapy",
+        "Veterinarians",
+    ],
+    "Pets": [
+        "Pet Groomers",
+        "Pet Boarding",
+        "Pet Stores",
+    ],
+    "Education & Childcare": [
+        "Daycares",
+        "Private Schools",
+        "Tutoring Centers",
+        "Learning Centers",
+    ],
+    "Professional Services": [
+        "Law Firms",
+        "Accountants",
+        "Consulting Firms",
+    ],
+    "Community & Nonprofits": [
+        "Churches",
+        "Nonprofits",
+        "Community Centers",
+    ],
+}
+
 
-    html = f"""{BASE_STYLE}
+# Rendered once at import through Flask's autoescaping Jinja environment, so
+# names like "Food & Drink" are escaped in the markup and JSON-quoted in onclick.
+HOME_TEMPLATE = """
 <div class='navbar'>
  <a href='/'>Home</a> |
  <a href='/previous'>Previous Runs</a> |
@@ -631,15 +1124,9 @@ def home():
 <h2>Select categories and enter ZIP & radius</h2>
 <form action='/run' method='get'>
   <div class='grid'>
-"""
-
-    for group_name, cats in grouped.items():
-        html += f"<div class='group'><h3 onclick=\"toggleGroup('{group_name}')\">{group_name}</h3>"
-        for c in cats:
-            html += f"<label><input type='checkbox' name='categories' value='{c}'> {c}</label><br>"
-        html += "</div>"
-
-    html += """
+{% for group_name, cats in groups.items() %}<div class='group'><h3 onclick='toggleGroup({{ group_name|tojson }})'>{{ group_name }}</h3>
+{%- for c in cats %}<label><input type='checkbox' name='categories' value='{{ c }}'> {{ c }}</label><br>{% endfor -%}
+</div>{% endfor %}
   </div><br>
   ZIP Code: <input type='text' name='zipcode' required>
   Radius (mi): <input type='text' name='radius' required value='10'><br><br>
@@ -659,20 +1146,53 @@ function toggleGroup(name){
 }
 </script>
 """
-    return render_template_string(html)
 
+HOME_HTML = BASE_STYLE + app.jinja_env.from_string(HOME_TEMPLATE).render(groups=CATEGORY_GROUPS)
 
-@app.route("/run")
-def run_scraper():
-    cats = request.args.getlist("categories")
-    zipc = request.args.get("zipcode", "23220")
-    rad = request.args.get("radius", "10")
+ABOUT_HTML = f"""{BASE_STYLE}
+<div class='navbar'><a href='/'>Home</a></div>
+<h1>About</h1>
+<p>Business Lead Scraper uses Google Places to find local businesses, extracts emails and phone numbers from their websites, and uploads them into Brevo:
+<br>List 3 = contacts with email
+<br>List 5 = contacts with no email but usable phone</p>
+"""
+
+HELP_HTML = f"""{BASE_STYLE}
+<div class='navbar'><a href='/'>Home</a></div>
+<h1>Help</h1>
+<p>
+1. Select one or more categories.<br>
+2. Enter the ZIP code and radius in miles.<br>
+3. Click "Start Search".<br>
+4. Watch the logs as businesses are discovered and uploaded to Brevo.<br>
+Timeout is 3 minutes; if at least 30 contacts are uploaded, it will stop early when the timer hits.
+</p>
+"""
 
-    import threading
+# home/about/help never change while the process runs; let browsers reuse them
+STATIC_PAGE_HEADERS = {"Cache-Control": "public, max-age=300"}
+PREVIOUS_CACHE_SECONDS = 5
+
+
+BUSY_HTML = f"""{BASE_STYLE}
+<div class='navbar'><a href='/'>Home</a></div>
+<h1>Scraper busy</h1>
+<p>A scraper is already running. Please wait for it to finish.</p>
+"""
 
-    threading.Thread(target=run_scraper_process, args=(cats, zipc, rad)).start()
+# Jinja templates are parsed once here; render_template_string re-parsed them
+# on every request. Flask's environment autoescapes, so file names are escaped.
+PREVIOUS_TEMPLATE = app.jinja_env.from_string(
+    BASE_STYLE
+    + """
+<div class='navbar'><a href='/'>Home</a></div>
+<h1>Previous Runs</h1>
+<ul>{% for f in files %}<li><a href='/runs/{{ f }}'>{{ f }}</a></li>{% endfor %}</ul>
+"""
+)
 
-    html = """
+RUN_PAGE_TEMPLATE = app.jinja_env.from_string(
+    """
 <style>
 body{
   background:#000;
@@ -713,65 +1233,117 @@ h2{color:#0099ff;}
 <h2>Running… Logs below</h2>
 <div id='log-box'></div>
 <script>
-async function fetchLogs(){
-  const r = await fetch('/logs');
-  const d = await r.json();
-  const box = document.getElementById('log-box');
-  box.innerHTML = d.logs.map(l => '<div>' + l + '</div>').join('');
+const box = document.getElementById('log-box');
+const es = new EventSource('/logs/stream?run={{ run_id }}');
+// a reconnect resumes after the last line received (Last-Event-ID), so lines only ever append
+es.onmessage = e => {
+  const div = document.createElement('div');
+  div.textContent = e.data;
+  box.appendChild(div);
   box.scrollTop = box.scrollHeight;
-}
-setInterval(fetchLogs, 2000);
+};
+// the run is over; closing stops the browser from reconnecting and replaying
+es.addEventListener('done', () => es.close());
 </script>
 """
-    return render_template_string(html)
+)
+
+
+@lru_cache(maxsize=1)
+def _render_previous(time_bucket: int) -> str:
+    # time_bucket only exists to expire the cache every PREVIOUS_CACHE_SECONDS
+    files = os.listdir("runs") if os.path.exists("runs") else []
+    return PREVIOUS_TEMPLATE.render(files=files)
+
+
+# --------------------------------------------------------------------
+# Routes
+# --------------------------------------------------------------------
+@app.route("/")
+def home():
+    return Response(HOME_HTML, mimetype="text/html", headers=STATIC_PAGE_HEADERS)
+
+
+@app.route("/run")
+def run_scraper():
+    cats = request.args.getlist("categories")
+    zipc = request.args.get("zipcode", "23220")
+    rad = request.args.get("radius", "10")
+
+    if not SCRAPER_LOCK.acquire(blocking=False):
+        return BUSY_HTML, 429
+
+    state = register_run()
+    threading.Thread(target=run_scraper_locked, args=(state, cats, zipc, rad)).start()
+
+    return RUN_PAGE_TEMPLATE.render(run_id=state.run_id)
 
 
 @app.route("/previous")
 def previous():
-    files = os.listdir("runs") if os.path.exists("runs") else []
-    links = "".join(f"<li><a href='/runs/{f}'>{f}</a></li>" for f in files)
-    return render_template_string(
-        f"""{BASE_STYLE}
-<div class='navbar'><a href='/'>Home</a></div>
-<h1>Previous Runs</h1>
-<ul>{links}</ul>
-"""
-    )
+    return _render_previous(int(time.time() // PREVIOUS_CACHE_SECONDS))
 
 
 @app.route("/about")
 def about():
-    return render_template_string(
-        f"""{BASE_STYLE}
-<div class='navbar'><a href='/'>Home</a></div>
-<h1>About</h1>
-<p>Business Lead Scraper uses Google Places to find local businesses, extracts emails and phone numbers from their websites, and uploads them into Brevo:
-<br>List 3 = contacts with email
-<br>List 5 = contacts with no email but usable phone</p>
-"""
-    )
+    return Response(ABOUT_HTML, mimetype="text/html", headers=STATIC_PAGE_HEADERS)
 
 
 @app.route("/help")
 def help_page():
-    return render_template_string(
-        f"""{BASE_STYLE}
-<div class='navbar'><a href='/'>Home</a></div>
-<h1>Help</h1>
-<p>
-1. Select one or more categories.<br>
-2. Enter the ZIP code and radius in miles.<br>
-3. Click "Start Search".<br>
-4. Watch the logs as businesses are discovered and uploaded to Brevo.<br>
-Timeout is 3 minutes; if at least 30 contacts are uploaded, it will stop early when the timer hits.
-</p>
-"""
-    )
+    return Response(HELP_HTML, mimetype="text/html", headers=STATIC_PAGE_HEADERS)
 
 
 @app.route("/logs")
 def logs():
-    return jsonify({"logs": scraper_logs})
+    """
+    JSON snapshot of a run's log. ?since=<seq> returns only newer lines;
+    pass the returned `last` back as `since` on the next call.
+    """
+    run_id = request.args.get("run")
+    state = get_run(run_id)
+    if state is None:
+        if not run_id:
+            # nothing has run since startup
+            return {"logs": [], "last": 0}
+        return {"error": "unknown run"}, 404
+    lines, last, done = state.since(request.args.get("since", 0, type=int))
+    return {"run": state.run_id, "done": done, "last": last, "logs": [entry for _, entry in lines]}
+
+
+@app.route("/logs/stream")
+def logs_stream():
+    """
+    Server-Sent Events feed for one run (?run=<id>, default latest):
+    replays its buffer once, pushes each new log line as it is written,
+    and sends a `done` event when the run finishes. A reconnecting
+    browser sends Last-Event-ID and only gets the lines it missed.
+    """
+    state = get_run(request.args.get("run"))
+    if state is None:
+        return "Unknown run", 404
+    last_seen = request.headers.get("Last-Event-ID", "0")
+    backlog, q, done = state.subscribe(int(last_seen) if last_seen.isdigit() else 0)
+
+    def event_stream():
+        try:
+            for item in backlog:
+                yield format_sse(item)
+            while not done:
+                try:
+                    item = q.get(timeout=15)
+                except queue.Empty:
+                    # comment line keeps proxies from closing an idle stream
+                    yield ": keep-alive\n\n"
+                    continue
+                if item is None:
+                    break
+                yield format_sse(item)
+            yield "event: done\ndata: \n\n"
+        finally:
+            state.unsubscribe(q)
+
+    return Response(event_stream(), mimetype="text/event-stream", headers={"Cache-Control": "no-cache"})
 
 
 # static file serving for /runs/*.xlsx if you want to hook that up later
@@ -783,4 +1355,8 @@ def download_run(filename):
 
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=10000)
\ No newline at end of file
+    # Production WSGI server. Keep a single process: run state (RUNS, lock)
+    # lives in memory, so extra workers must be threads.
+    from waitress import serve
+
+    serve(app, host="0.0.0.0", port=10000, threads=8)
\ No newline at end of file
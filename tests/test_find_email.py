@@ -0,0 +1,25 @@
+import os
+import unittest
+
+# the module refuses to import without API keys; these are never used here
+os.environ.setdefault("GOOGLE_API_KEY", "test")
+os.environ.setdefault("BREVO_API_KEY", "test")
+
+from richmond_lead_scraper import EMAIL_RE, FOOTER_CHARS, find_email  # noqa: E402
+
+
+class FindEmailTest(unittest.TestCase):
+    def test_footer_cut_inside_local_part(self):
+        # the footer window starts at "smith@...", mid-way through the address
+        footer = "smith@acme.com</p>"
+        html = "<p>" + "z " * 30000 + "john." + footer + " " * (FOOTER_CHARS - len(footer))
+        self.assertTrue(html[-FOOTER_CHARS:].startswith("smith@"))
+        self.assertEqual(find_email(html), "john.smith@acme.com")
+
+    def test_over_long_local_part_rejected(self):
+        self.assertIsNone(EMAIL_RE.search("a" * 70 + "@acme.com"))
+        self.assertEqual(find_email("<p>" + "a" * 64 + "@acme.com</p>"), "a" * 64 + "@acme.com")
+
+
+if __name__ == "__main__":
+    unittest.main()